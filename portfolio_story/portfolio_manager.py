@@ -266,13 +266,14 @@ class PortfolioManager:
             trade_orders = self.shopkeeper.calculate_share_quantities(
                 selected_assets, dollar_amounts
             )
-            buy_list = self.shopkeeper.create_buy_list(trade_orders, budget)
+            created_at = datetime.now()
+            buy_list = self.shopkeeper.create_buy_list(trade_orders, budget, now=created_at)
             
             # Step 8: Portfolio Summary
             # Compile all results into a comprehensive portfolio dictionary
             portfolio = {
-                'portfolio_id': f"PS_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                'created_at': datetime.now().isoformat(),
+                'portfolio_id': f"PS_{created_at.strftime('%Y%m%d_%H%M%S')}",
+                'created_at': created_at.isoformat(),
                 'parameters': {
                     'time_horizon': time_horizon,
                     'budget': budget,
@@ -424,7 +425,7 @@ class PortfolioManager:
         
         # Create rebalance plan
         rebalance_plan = self.caretaker.create_rebalance_plan(
-            current_allocation, target_allocation, portfolio_value
+            current_allocation, target_allocation, portfolio_value, include_timestamp=True
         )
         
         return rebalance_plan
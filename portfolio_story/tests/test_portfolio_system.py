@@ -22,6 +22,7 @@ from portfolio_story.safety.safety_officer import SafetyOfficer
 from portfolio_story.safety.risk_manager import RiskManager
 from portfolio_story.utils.shopkeeper import Shopkeeper
 from portfolio_story.utils.caretaker import Caretaker
+from portfolio_story.utils.validation import PortfolioValidator
 
 class TestPortfolioSystem(unittest.TestCase):
     """Test suite for the complete portfolio system"""
@@ -36,6 +37,7 @@ class TestPortfolioSystem(unittest.TestCase):
         self.risk_manager = RiskManager()
         self.shopkeeper = Shopkeeper()
         self.caretaker = Caretaker()
+        self.validator = PortfolioValidator()
         
         # Create sample data for testing
         self.sample_data = self._create_sample_data()
@@ -205,6 +207,8 @@ class TestPortfolioSystem(unittest.TestCase):
         dollar_amounts = self.shopkeeper.calculate_dollar_amounts(self.sample_allocation, 2500)
         self.assertIsInstance(dollar_amounts, dict)
         self.assertAlmostEqual(sum(dollar_amounts.values()), 2500, places=2)
+        half_cent = self.shopkeeper.calculate_dollar_amounts({'shares': 0.5}, 57412.65)
+        self.assertEqual(half_cent['shares'], 28706.33)
         
         # Test share quantity calculation
         sample_assets = {
@@ -218,7 +222,33 @@ class TestPortfolioSystem(unittest.TestCase):
             self.assertIn('ticker', trades[0])
             self.assertIn('shares', trades[0])
             self.assertIn('actual_cost', trades[0])
-    
+        
+        # Test buy list summary and execution breakdown
+        buy_list = self.shopkeeper.create_buy_list(trades, 2500)
+        self.assertEqual(buy_list['summary']['num_assets'], len(trades))
+        execution = self.shopkeeper.create_execution_summary(buy_list)
+        for asset_class, breakdown in execution['class_breakdown'].items():
+            self.assertAlmostEqual(breakdown['amount'], buy_list['summary']['class_totals'][asset_class])
+
+        # Test leftover cash tops up zero-score orders without overspending a large budget
+        orders = [{'ticker': 'CBA.AX', 'asset_class': 'shares', 'current_price': 95.50, 'shares': 1,
+                   'actual_cost': 95.50, 'leftover': 0.0, 'composite_score': 0.0}]
+        optimized = self.shopkeeper.optimize_leftover_cash(orders, 1000000)
+        self.assertEqual(optimized[0]['shares'], int(1000000 // 95.50))
+        self.assertLessEqual(optimized[0]['actual_cost'], 1000000)
+
+        # Test leftover cash goes to score-weighted dollars, skipping orders below the minimum
+        orders = [
+            {'ticker': 'CBA.AX', 'asset_class': 'shares', 'current_price': 60.0, 'shares': 1,
+             'actual_cost': 60.0, 'leftover': 0.0, 'composite_score': 0.9},
+            {'ticker': 'BHP.AX', 'asset_class': 'shares', 'current_price': 40.0, 'shares': 2,
+             'actual_cost': 80.0, 'leftover': 0.0, 'composite_score': 0.8},
+            {'ticker': 'GOLD.AX', 'asset_class': 'commodities', 'current_price': 30.0, 'shares': 1,
+             'actual_cost': 30.0, 'leftover': 0.0, 'composite_score': 1.0}
+        ]
+        optimized = self.shopkeeper.optimize_leftover_cash(orders, 270)
+        self.assertEqual([order['shares'] for order in optimized], [2, 3, 1])
+
     def test_caretaker_rebalancing(self):
         """Test Caretaker rebalancing functions"""
         # Test drift calculation
@@ -235,6 +265,40 @@ class TestPortfolioSystem(unittest.TestCase):
         self.assertIn('drift', plan)
         self.assertIn('trades', plan)
         self.assertIn('action_needed', plan)
+
+        # Test rebalance trades
+        trades = self.caretaker.calculate_rebalance_trades(current, target, 2500)
+        actions = {trade['asset_class']: trade['action'] for trade in trades}
+        self.assertEqual(actions, {'shares': 'SELL', 'bonds': 'BUY'})
+        for trade in trades:
+            self.assertAlmostEqual(trade['trade_size'], 125.0, places=2)
+
+        # Test compiled planner matches the one-shot plan
+        compiled_plan = self.caretaker.compile_for_target(target).plan(current, 2500)
+        self.assertEqual(compiled_plan['drift'], plan['drift'])
+        self.assertEqual(compiled_plan['trades'], plan['trades'])
+
+        # Test cached drift is not reused after the allocation changes
+        drifting = dict(current)
+        self.assertIs(self.caretaker.should_rebalance(drifting, target), False)
+        drifting.update({'shares': 0.80, 'bonds': 0.05, 'cash': 0.05})
+        reused_plan = self.caretaker.create_rebalance_plan(drifting, target, 2500)
+        fresh_plan = self.caretaker.create_rebalance_plan(dict(drifting), target, 2500)
+        self.assertEqual(reused_plan['trades'], fresh_plan['trades'])
+
+    def test_validator_checks(self):
+        """Test PortfolioValidator covariance checks"""
+        assets = ['SPY', 'BND', 'GLD']
+        
+        # Singular but positive semi-definite matrices are valid
+        zero_cov = pd.DataFrame(np.zeros((3, 3)), index=assets, columns=assets)
+        self.assertEqual(self.validator.validate_covariance_matrix(zero_cov), [])
+        
+        # Symmetric matrices with a negative eigenvalue are flagged
+        invalid_cov = pd.DataFrame([[0.04, 0.02, 0.03], [0.02, 0.01, 0.02], [0.03, 0.02, 0.05]],
+                                   index=assets, columns=assets)
+        results = self.validator.validate_covariance_matrix(invalid_cov)
+        self.assertEqual([r.field for r in results], ['positive_definite'])
     
     def test_integration_workflow(self):
         """Test complete integration workflow"""
@@ -54,6 +54,9 @@ app = dash.Dash(__name__, external_stylesheets=[
     'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap'
 ])
 
+# WSGI entry point for production servers (e.g. gunicorn portfolio_story.ui.dashboard:server)
+server = app.server
+
 # Professional CSS styling
 app.index_string = '''
 <!DOCTYPE html>
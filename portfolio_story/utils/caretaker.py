@@ -7,10 +7,92 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+ACTION_BUY = 1
+ACTION_SELL = -1
+
+
+@njit(cache=True)
+def _rebalance_kernel(cur, tgt, portfolio_value, min_trade_size):
+    """
+    Compute rebalancing trades for aligned weight arrays
+    
+    Args:
+        cur: Current weights (float64 array)
+        tgt: Target weights (float64 array, same order as cur)
+        portfolio_value: Current portfolio value
+        min_trade_size: Minimum trade size in dollars
+        
+    Returns:
+        Tuple of (mask, dollar, trade_size, action_code) parallel arrays
+    """
+    n = cur.shape[0]
+    mask = np.zeros(n, dtype=np.bool_)
+    dollar = np.empty(n, dtype=np.float64)
+    trade_size = np.empty(n, dtype=np.float64)
+    action_code = np.zeros(n, dtype=np.int8)
+    
+    for i in range(n):
+        weight_diff = tgt[i] - cur[i]
+        dollar_amount = weight_diff * portfolio_value
+        size = abs(dollar_amount)
+        dollar[i] = dollar_amount
+        trade_size[i] = size
+        
+        # Only if meaningful difference and above minimum trade size
+        if abs(weight_diff) > 0.001 and size >= min_trade_size:
+            mask[i] = True
+            action_code[i] = ACTION_BUY if dollar_amount > 0 else ACTION_SELL
+    
+    return mask, dollar, trade_size, action_code
+
+
+# Warm the kernel at import so the first real call doesn't pay the JIT cost
+_rebalance_kernel(np.zeros(1), np.zeros(1), 0.0, 0.0)
+
+
+def _allocation_arrays(current_allocation: Dict[str, float],
+                       target_allocation: Dict[str, float]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Align current and target allocations into float64 arrays keyed by target order"""
+    keys = list(target_allocation)
+    count = len(keys)
+    tgt = np.fromiter(target_allocation.values(), dtype=np.float64, count=count)
+    cur = np.fromiter((current_allocation.get(k, 0) for k in keys), dtype=np.float64, count=count)
+    return keys, cur, tgt
+
+@dataclass
+class _DriftResult:
+    """Drift of a current allocation against a target, aligned by target key order"""
+    keys: List[str]
+    cur: np.ndarray
+    tgt: np.ndarray
+    drift: np.ndarray
+    violations: np.ndarray
+    threshold: float
+    
+    def __bool__(self) -> bool:
+        return bool(self.violations.any())
+
+
+def _compute_drift(keys: List[str], cur: np.ndarray, tgt: np.ndarray,
+                   threshold: float) -> _DriftResult:
+    """Compute drift and threshold violations for aligned weight arrays"""
+    drift = cur - tgt
+    return _DriftResult(keys, cur, tgt, drift, np.abs(drift) > threshold, threshold)
+
+
 class Caretaker:
     """
     The Caretaker handles:
@@ -25,6 +107,9 @@ class Caretaker:
         self.min_trade_size = 100  # Minimum trade size in dollars
         self.max_turnover = 0.20  # Maximum 20% turnover per rebalance
         self.rebalance_frequency = 30  # Days between rebalances
+        # Single-slot drift cache: (current items, target items, _DriftResult)
+        # filled by should_rebalance and consumed by create_rebalance_plan
+        self._drift_cache = None
     
     def calculate_portfolio_drift(self, current_allocation: Dict[str, float], 
                                 target_allocation: Dict[str, float]) -> Dict[str, float]:
@@ -82,43 +167,60 @@ class Caretaker:
         Returns:
             List of rebalancing trades
         """
-        trades = []
+        keys, cur, tgt = _allocation_arrays(current_allocation, target_allocation)
+        return self._build_trades(keys, cur, tgt, portfolio_value)
+    
+    def _build_trades(self, keys: List[str], cur: np.ndarray, tgt: np.ndarray,
+                      portfolio_value: float) -> List[Dict]:
+        """Run the rebalancing kernel on aligned arrays and materialize trade dicts"""
+        mask, dollar, trade_size, action_code = _rebalance_kernel(
+            cur, tgt, float(portfolio_value), float(self.min_trade_size)
+        )
         
-        for asset_class in target_allocation:
-            current_weight = current_allocation.get(asset_class, 0)
-            target_weight = target_allocation[asset_class]
-            weight_diff = target_weight - current_weight
-            
-            if abs(weight_diff) > 0.001:  # Only if meaningful difference
-                dollar_amount = weight_diff * portfolio_value
-                
-                if abs(dollar_amount) >= self.min_trade_size:
-                    trade = {
-                        'asset_class': asset_class,
-                        'current_weight': current_weight,
-                        'target_weight': target_weight,
-                        'weight_diff': weight_diff,
-                        'dollar_amount': dollar_amount,
-                        'action': 'BUY' if dollar_amount > 0 else 'SELL',
-                        'trade_size': abs(dollar_amount)
-                    }
-                    trades.append(trade)
+        trades = []
+        for i in np.flatnonzero(mask):
+            trades.append({
+                'asset_class': keys[i],
+                'current_weight': float(cur[i]),
+                'target_weight': float(tgt[i]),
+                'weight_diff': float(tgt[i] - cur[i]),
+                'dollar_amount': float(dollar[i]),
+                'action': 'BUY' if action_code[i] == ACTION_BUY else 'SELL',
+                'trade_size': float(trade_size[i])
+            })
         
         return trades
     
+    def calculate_total_turnover(self, trades: List[Dict]) -> float:
+        """
+        Sum the dollar size of all trades
+        
+        Args:
+            trades: List of rebalancing trades
+            
+        Returns:
+            Total turnover in dollars
+        """
+        trade_sizes = np.fromiter((trade['trade_size'] for trade in trades),
+                                  dtype=np.float64, count=len(trades))
+        return float(trade_sizes.sum())
+    
     def check_turnover_limit(self, trades: List[Dict], 
-                           portfolio_value: float) -> bool:
+                           portfolio_value: float,
+                           total_turnover: float = None) -> bool:
         """
         Check if rebalancing trades exceed turnover limit
         
         Args:
             trades: List of rebalancing trades
             portfolio_value: Portfolio value
+            total_turnover: Precomputed total turnover (computed from trades if None)
             
         Returns:
             True if within turnover limit
         """
-        total_turnover = sum(trade['trade_size'] for trade in trades)
+        if total_turnover is None:
+            total_turnover = self.calculate_total_turnover(trades)
         turnover_percentage = total_turnover / portfolio_value
         
         return turnover_percentage <= self.max_turnover
@@ -151,7 +253,8 @@ class Caretaker:
     def create_rebalance_plan(self, current_allocation: Dict[str, float], 
                             target_allocation: Dict[str, float], 
                             portfolio_value: float,
-                            drift_threshold: float = None) -> Dict:
+                            drift_threshold: float = None,
+                            include_timestamp: bool = False) -> Dict:
         """
         Create complete rebalancing plan
         
@@ -160,43 +263,60 @@ class Caretaker:
             target_allocation: Target allocation
             portfolio_value: Portfolio value
             drift_threshold: Drift threshold
+            include_timestamp: Fill 'created_at' with the current time (None otherwise)
             
         Returns:
             Complete rebalancing plan
         """
-        # Calculate drift
-        drift = self.calculate_portfolio_drift(current_allocation, target_allocation)
-        
-        # Check threshold violations
-        violations = self.check_drift_threshold(drift, drift_threshold)
-        
-        # Calculate trades
-        trades = self.calculate_rebalance_trades(current_allocation, target_allocation, portfolio_value)
-        
-        # Filter by size
-        filtered_trades = self.filter_trades_by_size(trades)
-        
-        # Check turnover limit
-        within_turnover_limit = self.check_turnover_limit(filtered_trades, portfolio_value)
-        
-        # Prioritize trades
-        prioritized_trades = self.prioritize_trades(filtered_trades)
+        if drift_threshold is None:
+            drift_threshold = self.default_drift_threshold
+        
+        # Reuse the drift computed by a preceding should_rebalance call
+        drift_result = self._take_cached_drift(current_allocation, target_allocation,
+                                               drift_threshold)
+        if drift_result is not None:
+            planner = CompiledPlanner(self, drift_result.keys, drift_result.tgt, drift_threshold)
+            return planner.plan_from_drift(drift_result, portfolio_value, include_timestamp)
+        
+        return self.compile_for_target(target_allocation, drift_threshold).plan(
+            current_allocation, portfolio_value, include_timestamp
+        )
+    
+    def _take_cached_drift(self, current_allocation: Dict[str, float],
+                           target_allocation: Dict[str, float],
+                           threshold: float) -> Optional[_DriftResult]:
+        """Pop the cached drift if it was computed for allocations with these contents"""
+        cached = self._drift_cache
+        self._drift_cache = None
+        if cached is None:
+            return None
+        cached_current, cached_target, drift_result = cached
+        if (drift_result.threshold == threshold
+                and cached_current == tuple(current_allocation.items())
+                and cached_target == tuple(target_allocation.items())):
+            return drift_result
+        return None
+    
+    def compile_for_target(self, target_allocation: Dict[str, float],
+                           drift_threshold: float = None) -> 'CompiledPlanner':
+        """
+        Precompute the target-side state for repeated rebalancing plans
         
-        # Calculate summary metrics
-        total_turnover = sum(trade['trade_size'] for trade in prioritized_trades)
-        turnover_percentage = total_turnover / portfolio_value if portfolio_value > 0 else 0
+        Use this when the same target allocation is planned against many
+        current allocations (e.g. one call per day for a fixed risk profile).
         
-        return {
-            'drift': drift,
-            'violations': violations,
-            'trades': prioritized_trades,
-            'within_turnover_limit': within_turnover_limit,
-            'total_turnover': total_turnover,
-            'turnover_percentage': turnover_percentage,
-            'num_trades': len(prioritized_trades),
-            'action_needed': any(violations.values()),
-            'created_at': datetime.now().isoformat()
-        }
+        Args:
+            target_allocation: Target allocation
+            drift_threshold: Drift threshold (default from config)
+            
+        Returns:
+            CompiledPlanner bound to this target allocation
+        """
+        if drift_threshold is None:
+            drift_threshold = self.default_drift_threshold
+        keys = list(target_allocation)
+        target = np.fromiter(target_allocation.values(), dtype=np.float64, count=len(keys))
+        return CompiledPlanner(self, keys, target, drift_threshold)
     
     def should_rebalance(self, current_allocation: Dict[str, float], 
                         target_allocation: Dict[str, float],
@@ -204,6 +324,9 @@ class Caretaker:
         """
         Determine if portfolio should be rebalanced
         
+        The computed drift is cached so that an immediately following
+        create_rebalance_plan call with the same allocations reuses it.
+        
         Args:
             current_allocation: Current allocation
             target_allocation: Target allocation
@@ -212,6 +335,8 @@ class Caretaker:
         Returns:
             True if rebalancing is needed
         """
+        self._drift_cache = None
+        
         # Check time since last rebalance
         if last_rebalance_date:
             days_since_rebalance = (datetime.now() - last_rebalance_date).days
@@ -219,10 +344,12 @@ class Caretaker:
                 return False
         
         # Check drift threshold
-        drift = self.calculate_portfolio_drift(current_allocation, target_allocation)
-        violations = self.check_drift_threshold(drift)
+        keys, cur, tgt = _allocation_arrays(current_allocation, target_allocation)
+        drift_result = _compute_drift(keys, cur, tgt, self.default_drift_threshold)
+        self._drift_cache = (tuple(current_allocation.items()),
+                             tuple(target_allocation.items()), drift_result)
         
-        return any(violations.values())
+        return bool(drift_result)
     
     def create_rebalance_summary(self, rebalance_plan: Dict) -> str:
         """
@@ -237,33 +364,29 @@ class Caretaker:
         if not rebalance_plan['action_needed']:
             return "No rebalancing needed - portfolio within target allocation"
         
-        summary = []
-        summary.append("REBALANCING REQUIRED")
-        summary.append("=" * 40)
-        
-        # Show drift
-        summary.append("Current Drift:")
-        for asset_class, drift in rebalance_plan['drift'].items():
-            if abs(drift) > 0.01:  # Only show meaningful drift
-                summary.append(f"  {asset_class}: {drift:+.1%}")
-        
-        summary.append("")
-        
-        # Show trades
+        # Show drift (only meaningful drift) and trades
+        drift_lines = [f"  {asset_class}: {drift:+.1%}"
+                       for asset_class, drift in rebalance_plan['drift'].items()
+                       if abs(drift) > 0.01]
         if rebalance_plan['trades']:
-            summary.append("Required Trades:")
-            for trade in rebalance_plan['trades']:
-                action = trade['action']
-                amount = trade['dollar_amount']
-                summary.append(f"  {action} {trade['asset_class']}: ${amount:,.2f}")
+            trade_lines = ["Required Trades:"] + [
+                f"  {trade['action']} {trade['asset_class']}: ${trade['dollar_amount']:,.2f}"
+                for trade in rebalance_plan['trades']
+            ]
         else:
-            summary.append("No trades needed (below minimum size)")
-        
-        summary.append("")
-        summary.append(f"Total Turnover: {rebalance_plan['turnover_percentage']:.1%}")
-        summary.append(f"Number of Trades: {rebalance_plan['num_trades']}")
-        
-        return "\n".join(summary)
+            trade_lines = ["No trades needed (below minimum size)"]
+        
+        return "\n".join([
+            "REBALANCING REQUIRED",
+            "=" * 40,
+            "Current Drift:",
+            *drift_lines,
+            "",
+            *trade_lines,
+            "",
+            f"Total Turnover: {rebalance_plan['turnover_percentage']:.1%}",
+            f"Number of Trades: {rebalance_plan['num_trades']}"
+        ])
     
     def simulate_rebalance(self, current_allocation: Dict[str, float], 
                           trades: List[Dict]) -> Dict[str, float]:
@@ -292,6 +415,93 @@ class Caretaker:
         
         return new_allocation
 
+class CompiledPlanner:
+    """
+    Rebalancing planner specialized for a fixed target allocation
+    
+    Holds the target keys, target weight array and key index so each plan
+    only has to fill the current-weight array before running the kernel.
+    """
+    
+    def __init__(self, caretaker: Caretaker, keys: List[str], target: np.ndarray,
+                 drift_threshold: float):
+        self._caretaker = caretaker
+        self._keys = keys
+        self._target = target
+        self._key_to_idx = {key: i for i, key in enumerate(keys)}
+        self._threshold = drift_threshold
+    
+    def _current_array(self, current_allocation: Dict[str, float]) -> np.ndarray:
+        """Align the current allocation with the compiled target keys"""
+        cur = np.zeros(len(self._keys), dtype=np.float64)
+        key_to_idx = self._key_to_idx
+        for asset_class, weight in current_allocation.items():
+            idx = key_to_idx.get(asset_class)
+            if idx is not None:
+                cur[idx] = weight
+        return cur
+    
+    def plan(self, current_allocation: Dict[str, float], portfolio_value: float,
+             include_timestamp: bool = False) -> Dict:
+        """
+        Create complete rebalancing plan against the compiled target
+        
+        Args:
+            current_allocation: Current allocation
+            portfolio_value: Portfolio value
+            include_timestamp: Fill 'created_at' with the current time (None otherwise)
+            
+        Returns:
+            Complete rebalancing plan
+        """
+        cur = self._current_array(current_allocation)
+        drift_result = _compute_drift(self._keys, cur, self._target, self._threshold)
+        return self.plan_from_drift(drift_result, portfolio_value, include_timestamp)
+    
+    def plan_from_drift(self, drift_result: _DriftResult, portfolio_value: float,
+                        include_timestamp: bool = False) -> Dict:
+        """
+        Create complete rebalancing plan from an already computed drift
+        
+        Args:
+            drift_result: Drift aligned with the compiled target keys
+            portfolio_value: Portfolio value
+            include_timestamp: Fill 'created_at' with the current time (None otherwise)
+            
+        Returns:
+            Complete rebalancing plan
+        """
+        caretaker = self._caretaker
+        cur = drift_result.cur
+        drift = dict(zip(self._keys, drift_result.drift.tolist()))
+        violations = dict(zip(self._keys, drift_result.violations.tolist()))
+        
+        # Calculate trades (kernel already applies the minimum trade size)
+        trades = caretaker._build_trades(self._keys, cur, self._target, portfolio_value)
+        
+        # Check turnover limit
+        total_turnover = caretaker.calculate_total_turnover(trades)
+        within_turnover_limit = caretaker.check_turnover_limit(trades, portfolio_value,
+                                                               total_turnover)
+        
+        # Prioritize trades
+        prioritized_trades = caretaker.prioritize_trades(trades)
+        
+        # Calculate summary metrics
+        turnover_percentage = total_turnover / portfolio_value if portfolio_value > 0 else 0
+        
+        return {
+            'drift': drift,
+            'violations': violations,
+            'trades': prioritized_trades,
+            'within_turnover_limit': within_turnover_limit,
+            'total_turnover': total_turnover,
+            'turnover_percentage': turnover_percentage,
+            'num_trades': len(prioritized_trades),
+            'action_needed': bool(drift_result),
+            'created_at': datetime.now().isoformat() if include_timestamp else None
+        }
+
 # Example usage and testing
 if __name__ == "__main__":
     # Initialize the Caretaker
@@ -315,7 +525,8 @@ if __name__ == "__main__":
     portfolio_value = 2500
     
     # Create rebalance plan
-    plan = caretaker.create_rebalance_plan(current_allocation, target_allocation, portfolio_value)
+    plan = caretaker.create_rebalance_plan(current_allocation, target_allocation, portfolio_value,
+                                           include_timestamp=True)
     
     # Display results
     print("Rebalancing Plan:")
@@ -15,14 +15,404 @@ Key Features:
 
 import logging
 import logging.handlers
+import os
 import sys
 import json
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime
+import copy
+import queue
+import atexit
+import threading
+from typing import Dict, Any, List, Optional, Iterator, Mapping
 from pathlib import Path
-import traceback
 import functools
+import types
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class _ComponentRouter(logging.Handler):
+    """
+    Route queued records to the handlers registered for their logger name.
+    
+    Runs on the queue listener thread, so formatting and file I/O for every
+    component logger happen off the caller's thread.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._routes: Dict[str, List[logging.Handler]] = {}
+    
+    def register(self, name: str, handlers: List[logging.Handler]):
+        """Register the handlers that should receive records from logger `name`."""
+        self._routes[name] = handlers
+    
+    def handle(self, record):
+        for handler in self._routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def emit(self, record):
+        self.handle(record)
+
+class _ISOTimeFormatter(logging.Formatter):
+    """
+    Formatter whose formatTime returns ISO-8601 timestamps with milliseconds.
+    
+    The seconds part is cached, so records within the same second only pay
+    for the millisecond suffix instead of a datetime allocation each.
+    """
+    
+    default_time_format = '%Y-%m-%dT%H:%M:%S'
+    default_msec_format = '%s.%03d'
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._second_cache = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._second_cache = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+def _rotate_files(base_filename: str, backup_count: int):
+    """Shift base.1..base.N-1 up by one and move base to base.1, like RotatingFileHandler."""
+    for i in range(backup_count - 1, 0, -1):
+        source = f"{base_filename}.{i}"
+        dest = f"{base_filename}.{i + 1}"
+        if os.path.exists(source):
+            if os.path.exists(dest):
+                os.remove(dest)
+            os.rename(source, dest)
+    dest = base_filename + ".1"
+    if os.path.exists(dest):
+        os.remove(dest)
+    if os.path.exists(base_filename):
+        os.rename(base_filename, dest)
+
+def _dumps_json_bytes(obj: Any) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+class ConsoleHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes each record with a single write() call.
+    
+    The explicit flush is skipped when the stream is a TTY, since Python
+    already line-buffers interactive stdout.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        isatty = getattr(self.stream, 'isatty', None)
+        self._needs_flush = not (isatty is not None and isatty())
+    
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if self._needs_flush:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class BufferedCSVHandler(logging.Handler):
+    """
+    Size-rotated file handler that batches formatted records in memory.
+    
+    Records are written to disk in a single write once `capacity` records are
+    pending or `flush_interval` seconds have passed; a background thread
+    flushes stragglers. Rotation is checked once per flush, not per record.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 capacity: int = 256, flush_interval: float = 1.0, delay: bool = False):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer: List[bytes] = []
+        self._last_flush = time.monotonic()
+        self.stream = None if delay else self._open()
+        
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically,
+                                         name="BufferedCSVHandler-flush", daemon=True)
+        self._flusher.start()
+    
+    def _open(self):
+        return open(self.baseFilename, 'ab', buffering=0)
+    
+    def _flush_periodically(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+    
+    def emit(self, record):
+        try:
+            self._buffer.append((self.format(record) + '\n').encode('utf-8'))
+        except Exception:
+            self.handleError(record)
+            return
+        
+        if (len(self._buffer) >= self.capacity or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self._write_buffer()
+    
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+    
+    def _write_buffer(self):
+        """Write pending records in one call; caller must hold the handler lock."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        
+        data = b''.join(self._buffer)
+        self._buffer.clear()
+        
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0 and self.backupCount > 0:
+            if os.fstat(self.stream.fileno()).st_size + len(data) > self.maxBytes:
+                self._rollover()
+        self.stream.write(data)
+    
+    def _rollover(self):
+        """Rotate files the same way RotatingFileHandler does."""
+        self.stream.close()
+        _rotate_files(self.baseFilename, self.backupCount)
+        self.stream = self._open()
+    
+    def close(self):
+        self._stop_event.set()
+        self.acquire()
+        try:
+            self._write_buffer()
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+class BinaryJSONHandler(logging.Handler):
+    """
+    Size-rotated handler writing one JSON document per line as raw bytes.
+    
+    Each record is turned into the audit entry dict and serialized straight
+    to an unbuffered binary append-mode file with a single write, skipping
+    the Formatter/str/encode path. Nothing is held in user space, so a
+    crashed process keeps every audit record it emitted. Data is fsync'ed
+    when the file is rotated.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 delay: bool = False):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self._time_formatter = _ISOTimeFormatter()
+        self.stream = None if delay else self._open()
+    
+    def _open(self):
+        return open(self.baseFilename, 'ab', buffering=0)
+    
+    def _build(self, record) -> Dict[str, Any]:
+        fields = record.__dict__
+        return {
+            'timestamp': self._time_formatter.formatTime(record),
+            'level': record.levelname,
+            'component': fields.get('component', 'unknown'),
+            'action': fields.get('action', 'unknown'),
+            'user_id': fields.get('user_id', 'system'),
+            'portfolio_id': fields.get('portfolio_id'),
+            'message': record.getMessage(),
+            'details': fields.get('details', {})
+        }
+    
+    def emit(self, record):
+        try:
+            data = _dumps_json_bytes(self._build(record)) + b'\n'
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.backupCount > 0:
+                if self.stream.tell() + len(data) > self.maxBytes:
+                    self._rollover()
+            self.stream.write(data)
+        except Exception:
+            self.handleError(record)
+    
+    def _rollover(self):
+        os.fsync(self.stream.fileno())
+        self.stream.close()
+        _rotate_files(self.baseFilename, self.backupCount)
+        self.stream = self._open()
+    
+    def flush(self):
+        # The file is unbuffered, so this only matters for a replaced stream
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+# Component loggers only enqueue records; a single listener thread drains them
+_log_queue = queue.Queue(-1)
+_component_router = _ComponentRouter()
+_queue_listener = None
+
+def _ensure_queue_listener():
+    """Start the shared queue listener once and stop it at interpreter exit."""
+    global _queue_listener
+    if _queue_listener is None:
+        _queue_listener = logging.handlers.QueueListener(_log_queue, _component_router)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+
+@functools.lru_cache(maxsize=None)
+def _ensure_log_dir(log_dir: str) -> Path:
+    """Create a log directory once per process and return it as a Path."""
+    path = Path(log_dir)
+    path.mkdir(exist_ok=True)
+    return path
+
+def _format_context(context: Dict[str, Any]) -> str:
+    """Render context as 'key=value | key=value' without per-item f-strings."""
+    parts = []
+    append = parts.append
+    for key, value in context.items():
+        append(key)
+        append('=')
+        append(str(value))
+        append(' | ')
+    parts.pop()
+    return ''.join(parts)
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRS = frozenset(logging.LogRecord('', 0, '', 0, '', (), None).__dict__) | {
+    'message', 'asctime', 'taskName'
+}
+
+class ContextFormatter(logging.Formatter):
+    """
+    Formatter that appends a record's extra fields as ' | Context: k=v | ...'.
+    
+    Component loggers pass their context as structured `extra` fields, so
+    text output renders it here, on the listener thread, instead of at the
+    call site.
+    """
+    
+    def formatMessage(self, record):
+        formatted = super().formatMessage(record)
+        context = {key: value for key, value in record.__dict__.items()
+                   if key not in _RECORD_ATTRS}
+        if not context:
+            return formatted
+        return formatted + " | Context: " + _format_context(context)
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a same-process queue.
+    
+    The message is merged eagerly (its args may be mutated later), but
+    exc_info is kept so the listener thread formats the traceback.
+    """
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+@functools.lru_cache(maxsize=256)
+def _perf_template(operation: str) -> str:
+    """Message template for log_performance; the duration is merged lazily."""
+    return "Performance: " + operation.replace('%', '%%') + " completed in %.3fs"
+
+def _shared_handlers(log_dir: str) -> List[logging.Handler]:
+    """
+    Console, combined log and error log handlers shared by all component loggers.
+    
+    Every component writes to the same portfolio.log / errors.log pair; the
+    component is identified by the %(name)s field of each line. Spellings of
+    the same directory ("logs", "logs/", an absolute path) share one set.
+    """
+    return _build_shared_handlers(str(Path(log_dir).resolve()))
+
+@functools.lru_cache(maxsize=None)
+def _build_shared_handlers(log_dir: str) -> List[logging.Handler]:
+    """Create the shared handler set for a resolved log directory."""
+    _ensure_log_dir(log_dir)
+    
+    # Console handler for INFO and above
+    console_handler = ConsoleHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    console_formatter = ContextFormatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    console_handler.setFormatter(console_formatter)
+    
+    # File handler for all levels
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(log_dir, "portfolio.log"),
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        delay=True  # Open the file on first emit
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_formatter = ContextFormatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    file_handler.setFormatter(file_formatter)
+    
+    # Error file handler
+    error_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(log_dir, "errors.log"),
+        maxBytes=5*1024*1024,  # 5MB
+        backupCount=3,
+        delay=True  # Open the file on first emit
+    )
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(file_formatter)
+    
+    return [console_handler, file_handler, error_handler]
 
 class PortfolioLogger:
     """
@@ -33,17 +423,19 @@ class PortfolioLogger:
     monitoring, and audit trails.
     """
     
-    def __init__(self, name: str, log_dir: str = "logs"):
+    def __init__(self, name: str, log_dir: str = "logs",
+                 handlers: Optional[List[logging.Handler]] = None):
         """
         Initialize portfolio logger.
         
         Args:
             name: Logger name (usually module name)
             log_dir: Directory for log files
+            handlers: Handlers to use instead of the shared ones for log_dir
         """
         self.name = name
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+        self.log_dir = _ensure_log_dir(str(log_dir))
+        self._log_dir_str = str(self.log_dir)
         
         # Create logger
         self.logger = logging.getLogger(name)
@@ -51,43 +443,27 @@ class PortfolioLogger:
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
-            self._setup_handlers()
-    
-    def _setup_handlers(self):
-        """Setup logging handlers for different log levels."""
-        # Console handler for INFO and above
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+            self._setup_handlers(handlers)
+    
+    def _setup_handlers(self, handlers: Optional[List[logging.Handler]] = None):
+        """
+        Attach this logger to its console and file handlers.
         
-        # File handler for all levels
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.log_dir / f"{self.name}.log",
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        The handlers run on the shared queue listener thread; the logger itself
+        only gets a QueueHandler so callers never block on I/O.
         
-        # Error file handler
-        error_handler = logging.handlers.RotatingFileHandler(
-            self.log_dir / f"{self.name}_errors.log",
-            maxBytes=5*1024*1024,  # 5MB
-            backupCount=3
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_formatter)
-        self.logger.addHandler(error_handler)
+        Args:
+            handlers: Handlers to route this logger's records to (defaults to
+                the handlers shared by every component logging to log_dir)
+        """
+        if handlers is None:
+            handlers = _shared_handlers(self._log_dir_str)
+        
+        # Hand the real handlers to the listener and enqueue from the logger
+        _component_router.register(self.name, handlers)
+        self._log_queue = _log_queue
+        self.logger.addHandler(_InProcessQueueHandler(self._log_queue))
+        _ensure_queue_listener()
     
     def debug(self, message: str, **kwargs):
         """Log debug message with additional context."""
@@ -103,48 +479,117 @@ class PortfolioLogger:
     
     def error(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log error message with optional exception details."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         if exception:
             kwargs['exception_type'] = type(exception).__name__
             kwargs['exception_message'] = str(exception)
-            kwargs['traceback'] = traceback.format_exc()
         
-        self._log_with_context(logging.ERROR, message, **kwargs)
+        # The traceback is rendered by the handlers' formatters from exc_info
+        self._log_with_context(logging.ERROR, message, exc_info=exception, **kwargs)
     
     def critical(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Log critical message with optional exception details."""
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
         if exception:
             kwargs['exception_type'] = type(exception).__name__
             kwargs['exception_message'] = str(exception)
-            kwargs['traceback'] = traceback.format_exc()
         
-        self._log_with_context(logging.CRITICAL, message, **kwargs)
-    
-    def _log_with_context(self, level: int, message: str, **kwargs):
-        """Log message with additional context information."""
-        if kwargs:
-            context_str = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-            full_message = f"{message} | Context: {context_str}"
-        else:
-            full_message = message
+        self._log_with_context(logging.CRITICAL, message, exc_info=exception, **kwargs)
+    
+    def _log_with_context(self, level: int, message: str, *args,
+                          exc_info: Optional[Exception] = None, **kwargs):
+        """
+        Log message with additional context information.
+        
+        `args` are %-style arguments for `message`, merged lazily by logging.
+        `exc_info` attaches an exception whose traceback the formatters render.
+        Context is passed as `extra` fields; keys that clash with standard
+        LogRecord attributes are stored with a `context_` prefix.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
         
-        self.logger.log(level, full_message)
+        # Context travels as record attributes; ContextFormatter renders it
+        if kwargs and not _RECORD_ATTRS.isdisjoint(kwargs):
+            kwargs = {(f"context_{k}" if k in _RECORD_ATTRS else k): v
+                      for k, v in kwargs.items()}
+        self.logger.log(level, message, *args, exc_info=exc_info, extra=kwargs or None)
     
     def log_performance(self, operation: str, duration: float, **metrics):
         """Log performance metrics for operations."""
-        self.info(f"Performance: {operation} completed in {duration:.3f}s", 
-                 op_name=operation, duration=duration, **metrics)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self._log_with_context(logging.INFO, _perf_template(operation), duration,
+                               op_name=operation, duration=duration, **metrics)
     
     def log_portfolio_action(self, action: str, portfolio_id: str, **details):
         """Log portfolio-related actions for audit trail."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.info(f"Portfolio Action: {action}", 
                  action_type=action, portfolio_id=portfolio_id, **details)
     
     def log_optimization_result(self, method: str, objective_value: float, **details):
         """Log optimization results."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.info(f"Optimization: {method} achieved objective {objective_value:.6f}", 
                  opt_method=method, objective_value=objective_value, **details)
 
-def setup_portfolio_logging(log_dir: str = "logs", level: str = "INFO") -> Dict[str, PortfolioLogger]:
+# Components that get their own logger; anything else falls back to portfolio_manager
+COMPONENT_LOGGERS = (
+    'portfolio_manager',
+    'data_librarian',
+    'research_crew',
+    'planner',
+    'risk_manager',
+    'selector',
+    'safety_officer',
+    'shopkeeper',
+    'caretaker',
+    'config',
+    'dashboard',
+    'api'
+)
+
+class _LoggerRegistry(Mapping):
+    """
+    Lazily created component loggers for one log directory.
+    
+    A read-only mapping over COMPONENT_LOGGERS: loggers are only built the
+    first time a component asks for one, then memoized by name. All of them
+    share one set of console/file handlers.
+    """
+    
+    def __init__(self, log_dir: str = "logs"):
+        self.log_dir = _ensure_log_dir(str(log_dir))
+        self.handlers = _shared_handlers(str(log_dir))
+        self._cache: Dict[str, PortfolioLogger] = {}
+    
+    def __getitem__(self, name: str) -> PortfolioLogger:
+        logger = self._cache.get(name)
+        if logger is None:
+            if name not in COMPONENT_LOGGERS:
+                raise KeyError(name)
+            logger = self._cache[name] = PortfolioLogger(name, self.log_dir, self.handlers)
+        return logger
+    
+    def __contains__(self, name: object) -> bool:
+        # Membership must not build the logger
+        return name in COMPONENT_LOGGERS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(COMPONENT_LOGGERS)
+    
+    def __len__(self) -> int:
+        return len(COMPONENT_LOGGERS)
+
+# Registries memoized per log directory
+_registries: Dict[str, _LoggerRegistry] = {}
+
+def setup_portfolio_logging(log_dir: str = "logs", level: str = "INFO") -> Mapping[str, PortfolioLogger]:
     """
     Setup comprehensive logging for the entire portfolio management system.
     
@@ -153,26 +598,17 @@ def setup_portfolio_logging(log_dir: str = "logs", level: str = "INFO") -> Dict[
         level: Global logging level
         
         Returns:
-            Dictionary of component loggers
+            Mapping of component loggers, each created on first access
     """
     # Set global logging level
     logging.basicConfig(level=getattr(logging, level.upper()))
+    _ensure_queue_listener()
     
-    # Create component loggers
-    loggers = {
-        'portfolio_manager': PortfolioLogger('portfolio_manager', log_dir),
-        'data_librarian': PortfolioLogger('data_librarian', log_dir),
-        'research_crew': PortfolioLogger('research_crew', log_dir),
-        'planner': PortfolioLogger('planner', log_dir),
-        'risk_manager': PortfolioLogger('risk_manager', log_dir),
-        'selector': PortfolioLogger('selector', log_dir),
-        'safety_officer': PortfolioLogger('safety_officer', log_dir),
-        'shopkeeper': PortfolioLogger('shopkeeper', log_dir),
-        'caretaker': PortfolioLogger('caretaker', log_dir),
-        'config': PortfolioLogger('config', log_dir),
-        'dashboard': PortfolioLogger('dashboard', log_dir),
-        'api': PortfolioLogger('api', log_dir)
-    }
+    # Component loggers are created lazily by the registry
+    registry_key = str(Path(log_dir).resolve())
+    loggers = _registries.get(registry_key)
+    if loggers is None:
+        loggers = _registries[registry_key] = _LoggerRegistry(log_dir)
     
     # Log system startup
     main_logger = loggers['portfolio_manager']
@@ -181,26 +617,51 @@ def setup_portfolio_logging(log_dir: str = "logs", level: str = "INFO") -> Dict[
     
     return loggers
 
+class _PerfWrap:
+    """
+    Callable wrapper used by log_function_performance.
+    
+    Hot-path state (wrapped function, bound logger methods) lives in slots so
+    each call avoids closure and attribute-dict lookups; `__get__` makes it
+    bind like a plain function when used on methods.
+    """
+    
+    __slots__ = ('func', 'name', 'log_perf', 'log_err', 'is_enabled', '__dict__')
+    
+    def __init__(self, func, logger: PortfolioLogger):
+        self.func = func
+        self.name = func.__name__
+        self.log_perf = logger.log_performance
+        self.log_err = logger.error
+        self.is_enabled = logger.logger.isEnabledFor
+        functools.update_wrapper(self, func)
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+    
+    def __call__(self, *args, **kwargs):
+        start_ns = time.perf_counter_ns()
+        try:
+            result = self.func(*args, **kwargs)
+        except Exception as e:
+            duration = (time.perf_counter_ns() - start_ns) * 1e-9
+            self.log_err(f"Function {self.name} failed", exception=e,
+                         duration=duration, args_count=len(args),
+                         kwargs_count=len(kwargs))
+            raise
+        
+        # Skip timing and context building when INFO records would be dropped
+        if self.is_enabled(logging.INFO):
+            duration = (time.perf_counter_ns() - start_ns) * 1e-9
+            self.log_perf(self.name, duration, success=True)
+        return result
+
 def log_function_performance(logger: PortfolioLogger):
     """Decorator to log function performance."""
     def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
-                result = func(*args, **kwargs)
-                duration = time.time() - start_time
-                logger.log_performance(func.__name__, duration, 
-                                     success=True, args_count=len(args), 
-                                     kwargs_count=len(kwargs))
-                return result
-            except Exception as e:
-                duration = time.time() - start_time
-                logger.error(f"Function {func.__name__} failed", exception=e,
-                           duration=duration, args_count=len(args), 
-                           kwargs_count=len(kwargs))
-                raise
-        return wrapper
+        return _PerfWrap(func, logger)
     return decorator
 
 def log_portfolio_decision(logger: PortfolioLogger):
@@ -208,62 +669,56 @@ def log_portfolio_decision(logger: PortfolioLogger):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            is_enabled = logger.logger.isEnabledFor
+            want_info = is_enabled(logging.INFO)
             try:
                 result = func(*args, **kwargs)
-                # Extract portfolio information from result if possible
-                if isinstance(result, dict) and 'portfolio_id' in result:
-                    logger.log_portfolio_action(func.__name__, result['portfolio_id'],
-                                              decision_type=func.__name__, 
-                                              success=True)
-                else:
-                    logger.log_portfolio_action(func.__name__, "unknown",
-                                              decision_type=func.__name__, 
-                                              success=True)
-                return result
             except Exception as e:
-                logger.error(f"Portfolio decision {func.__name__} failed", exception=e)
+                if is_enabled(logging.ERROR):
+                    logger.error(f"Portfolio decision {func.__name__} failed", exception=e)
                 raise
+            
+            # Only inspect the result when the INFO record will be kept
+            if want_info:
+                if isinstance(result, dict) and 'portfolio_id' in result:
+                    portfolio_id = result['portfolio_id']
+                else:
+                    portfolio_id = "unknown"
+                logger.log_portfolio_action(func.__name__, portfolio_id,
+                                          decision_type=func.__name__, 
+                                          success=True)
+            return result
         return wrapper
     return decorator
 
+# Invariant audit fields for portfolio change records
+_PORTFOLIO_CHANGE_EXTRA = MappingProxyType({
+    'component': 'portfolio_manager',
+    'action': 'portfolio_change'
+})
+
 class AuditLogger:
     """
     Specialized logger for audit trails and compliance tracking.
     """
     
     def __init__(self, log_dir: str = "logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+        self.log_dir = _ensure_log_dir(str(log_dir))
+        self._log_dir_str = str(self.log_dir)
         
         # Create audit logger
         self.logger = logging.getLogger('audit')
         self.logger.setLevel(logging.INFO)
         
         if not self.logger.handlers:
-            # Audit file handler
-            audit_handler = logging.handlers.RotatingFileHandler(
-                self.log_dir / "audit.log",
+            # Audit file handler writing JSON lines straight to disk
+            audit_handler = BinaryJSONHandler(
+                os.path.join(self._log_dir_str, "audit.log"),
                 maxBytes=20*1024*1024,  # 20MB
-                backupCount=10
+                backupCount=10,
+                delay=True  # Open the file on first emit
             )
             audit_handler.setLevel(logging.INFO)
-            
-            # JSON formatter for structured audit logs
-            class JSONFormatter(logging.Formatter):
-                def format(self, record):
-                    log_entry = {
-                        'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-                        'level': record.levelname,
-                        'component': getattr(record, 'component', 'unknown'),
-                        'action': getattr(record, 'action', 'unknown'),
-                        'user_id': getattr(record, 'user_id', 'system'),
-                        'portfolio_id': getattr(record, 'portfolio_id', None),
-                        'message': record.getMessage(),
-                        'details': getattr(record, 'details', {})
-                    }
-                    return json.dumps(log_entry, default=str)
-            
-            audit_handler.setFormatter(JSONFormatter())
             self.logger.addHandler(audit_handler)
     
     def log_user_action(self, user_id: str, action: str, component: str, 
@@ -293,15 +748,13 @@ class AuditLogger:
         """Log portfolio changes for audit trail."""
         self.logger.info(f"Portfolio change: {change_type}", 
                         extra={
-                            'component': 'portfolio_manager',
-                            'action': 'portfolio_change',
+                            **_PORTFOLIO_CHANGE_EXTRA,
                             'portfolio_id': portfolio_id,
                             'user_id': user_id,
                             'details': {
                                 'change_type': change_type,
                                 'old_values': old_values,
-                                'new_values': new_values,
-                                'timestamp': datetime.now().isoformat()
+                                'new_values': new_values
                             }
                         })
 
@@ -311,36 +764,42 @@ class PerformanceLogger:
     """
     
     def __init__(self, log_dir: str = "logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+        self.log_dir = _ensure_log_dir(str(log_dir))
+        self._log_dir_str = str(self.log_dir)
         
         # Create performance logger
         self.logger = logging.getLogger('performance')
         self.logger.setLevel(logging.INFO)
         
         if not self.logger.handlers:
-            # Performance file handler
-            perf_handler = logging.handlers.RotatingFileHandler(
-                self.log_dir / "performance.log",
+            # Performance file handler, batching writes to amortize I/O
+            perf_handler = BufferedCSVHandler(
+                os.path.join(self._log_dir_str, "performance.log"),
                 maxBytes=50*1024*1024,  # 50MB
-                backupCount=5
+                backupCount=5,
+                delay=True  # Open the file on first flush
             )
             perf_handler.setLevel(logging.INFO)
             
             # CSV-like formatter for performance metrics
-            class PerformanceFormatter(logging.Formatter):
+            class PerformanceFormatter(_ISOTimeFormatter):
+                # timestamp,level,operation,duration,memory_usage,cpu_usage,success,message
+                _FMT = "%s,%s,%s,%.6f,%.2f,%.2f,%s,%s"
+                
                 def format(self, record):
-                    return (f"{datetime.fromtimestamp(record.created).isoformat()},"
-                           f"{record.levelname},"
-                           f"{getattr(record, 'operation', 'unknown')},"
-                           f"{getattr(record, 'duration', 0):.6f},"
-                           f"{getattr(record, 'memory_usage', 0):.2f},"
-                           f"{getattr(record, 'cpu_usage', 0):.2f},"
-                           f"{getattr(record, 'success', 'unknown')},"
-                           f"{record.getMessage()}")
+                    fields = record.__dict__
+                    return self._FMT % (self.formatTime(record),
+                                        record.levelname,
+                                        fields.get('operation', 'unknown'),
+                                        fields.get('duration', 0),
+                                        fields.get('memory_usage', 0),
+                                        fields.get('cpu_usage', 0),
+                                        fields.get('success', 'unknown'),
+                                        record.getMessage())
             
             perf_handler.setFormatter(PerformanceFormatter())
             self.logger.addHandler(perf_handler)
+            atexit.register(perf_handler.flush)
     
     def log_operation(self, operation: str, duration: float, success: bool = True,
                      memory_usage: float = 0.0, cpu_usage: float = 0.0, **metrics):
@@ -381,7 +840,7 @@ def get_logger(component: str) -> PortfolioLogger:
     if _loggers is None:
         _loggers = setup_portfolio_logging()
     
-    return _loggers.get(component, _loggers['portfolio_manager'])
+    return _loggers.get(component) or _loggers['portfolio_manager']
 
 def get_audit_logger() -> AuditLogger:
     """Get audit logger instance."""
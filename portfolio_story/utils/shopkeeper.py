@@ -8,9 +8,122 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 logger = logging.getLogger(__name__)
 
+# Largest leftover (in cents) solved exactly by the knapsack; cash above it
+# goes to the best-scoring order first, which bounds the DP's time and memory
+KNAPSACK_MAX_CENTS = 20000
+
+# Added to every composite score so zero-score orders can still take leftover cash
+SCORE_FLOOR = 1e-6
+
+
+@njit(cache=True)
+def _alloc_kernel(prices, weights, class_budget, min_trade):
+    """
+    Compute whole-share allocations for flattened asset arrays
+    
+    Args:
+        prices: Current price per asset (float64 array)
+        weights: Weight of each asset within its class (float64 array)
+        class_budget: Dollar budget of each asset's class (float64 array)
+        min_trade: Minimum trade size in dollars
+        
+    Returns:
+        Tuple of (target_amount, shares, actual_cost, leftover, mask) parallel arrays
+    """
+    n = prices.shape[0]
+    target_amount = np.zeros(n, dtype=np.float64)
+    shares = np.zeros(n, dtype=np.int64)
+    actual_cost = np.zeros(n, dtype=np.float64)
+    leftover = np.zeros(n, dtype=np.float64)
+    mask = np.zeros(n, dtype=np.bool_)
+    
+    for i in range(n):
+        if prices[i] > 0 and weights[i] > 0:
+            amount = class_budget[i] * weights[i]
+            count = np.int64(amount / prices[i])
+            cost = count * prices[i]
+            target_amount[i] = amount
+            shares[i] = count
+            actual_cost[i] = cost
+            leftover[i] = amount - cost
+            mask[i] = cost >= min_trade
+    
+    return target_amount, shares, actual_cost, leftover, mask
+
+
+@njit(cache=True)
+def _knapsack_kernel(price_cents, values, capacity):
+    """
+    Spend leftover cash as an unbounded knapsack over whole shares
+    
+    Args:
+        price_cents: Share price per order in integer cents (int64 array)
+        values: Value of one extra share per order (float64 array)
+        capacity: Cash available in integer cents
+        
+    Returns:
+        Number of additional shares per order (int64 array)
+    """
+    n = price_cents.shape[0]
+    best_value = np.zeros(capacity + 1, dtype=np.float64)
+    choice = np.full(capacity + 1, -1, dtype=np.int64)
+    
+    for c in range(1, capacity + 1):
+        best = best_value[c - 1]
+        pick = -1
+        for i in range(n):
+            cost = price_cents[i]
+            if 0 < cost <= c and values[i] > 0:
+                candidate = best_value[c - cost] + values[i]
+                if candidate > best:
+                    best = candidate
+                    pick = i
+        best_value[c] = best
+        choice[c] = pick
+    
+    # Walk the choices back from full capacity to recover share counts
+    additional_shares = np.zeros(n, dtype=np.int64)
+    c = capacity
+    while c > 0:
+        i = choice[c]
+        if i < 0:
+            c -= 1
+        else:
+            additional_shares[i] += 1
+            c -= price_cents[i]
+    
+    return additional_shares
+
+
+@lru_cache(maxsize=256)
+def _dollar_amounts(allocation_items: Tuple[Tuple[str, float], ...], total_budget: float,
+                    rounding_precision: int) -> Tuple[float, ...]:
+    """Rounded dollar amount per allocation entry, in allocation order"""
+    percentages = np.fromiter((percentage for _, percentage in allocation_items),
+                              dtype=np.float64, count=len(allocation_items))
+    # Built-in round() on each value: np.round can land a cent lower on half-cent amounts
+    return tuple(round(amount, rounding_precision)
+                 for amount in (percentages * total_budget).tolist())
+
+
+# Warm the kernels at import so the first real call doesn't pay the JIT cost
+_alloc_kernel(np.ones(1), np.ones(1), np.ones(1), 0.0)
+_knapsack_kernel(np.ones(1, dtype=np.int64), np.ones(1), 1)
+
+
 class Shopkeeper:
     """
     The Shopkeeper handles:
@@ -20,6 +133,9 @@ class Shopkeeper:
     4. Creating executable trade orders
     """
     
+    # Row layout of the buy-list table, parsed once and reused for every order
+    ROW_TMPL = "{ticker:<12} ${current_price:<7.2f} {shares:<8} ${actual_cost:<11.2f} {pct:<5.1f}%"
+    
     def __init__(self):
         self.min_trade_size = 50  # Minimum trade size in dollars
         self.rounding_precision = 2  # Decimal places for dollar amounts
@@ -36,13 +152,10 @@ class Shopkeeper:
         Returns:
             Dollar amounts for each asset class
         """
-        dollar_amounts = {}
+        dollar_amounts = _dollar_amounts(tuple(allocation.items()), total_budget,
+                                         self.rounding_precision)
         
-        for asset_class, percentage in allocation.items():
-            dollar_amount = total_budget * percentage
-            dollar_amounts[asset_class] = round(dollar_amount, self.rounding_precision)
-        
-        return dollar_amounts
+        return dict(zip(allocation, dollar_amounts))
     
     def calculate_share_quantities(self, selected_assets: Dict[str, List[Dict]], 
                                  dollar_amounts: Dict[str, float]) -> List[Dict]:
@@ -56,43 +169,50 @@ class Shopkeeper:
         Returns:
             List of trade orders with share quantities
         """
-        trade_orders = []
+        # Flatten the selected assets into parallel arrays (one slot per asset)
+        asset_classes = list(selected_assets)
+        class_counts = [len(assets) for assets in selected_assets.values()]
+        flat_assets = [asset for assets in selected_assets.values() for asset in assets]
+        num_assets = len(flat_assets)
+        if num_assets == 0:
+            return []
         
-        for asset_class, assets in selected_assets.items():
-            class_budget = dollar_amounts.get(asset_class, 0)
-            
-            for asset in assets:
-                ticker = asset['ticker']
-                current_price = asset.get('current_price', 0)
-                weight = asset.get('weight', 0)
-                
-                if current_price > 0 and weight > 0:
-                    # Calculate dollar amount for this asset
-                    asset_dollar_amount = class_budget * weight
-                    
-                    # Calculate share quantity (whole shares only)
-                    shares = int(asset_dollar_amount / current_price)
-                    actual_cost = shares * current_price
-                    leftover = asset_dollar_amount - actual_cost
-                    
-                    # Only include if meets minimum trade size
-                    if actual_cost >= self.min_trade_size:
-                        trade_order = {
-                            'ticker': ticker,
-                            'asset_class': asset_class,
-                            'current_price': current_price,
-                            'target_amount': asset_dollar_amount,
-                            'shares': shares,
-                            'actual_cost': actual_cost,
-                            'leftover': leftover,
-                            'weight': weight,
-                            'allocation_percentage': asset.get('allocation_percentage', 0),
-                            'composite_score': asset.get('composite_score', 0)
-                        }
-                        
-                        trade_orders.append(trade_order)
-                    else:
-                        logger.info(f"Skipping {ticker}: trade size ${actual_cost:.2f} below minimum ${self.min_trade_size}")
+        prices = np.fromiter((asset.get('current_price', 0) for asset in flat_assets),
+                             dtype=np.float64, count=num_assets)
+        weights = np.fromiter((asset.get('weight', 0) for asset in flat_assets),
+                              dtype=np.float64, count=num_assets)
+        class_budgets = np.repeat(
+            np.fromiter((dollar_amounts.get(asset_class, 0) for asset_class in asset_classes),
+                        dtype=np.float64, count=len(asset_classes)),
+            class_counts
+        )
+        class_names = np.repeat(np.array(asset_classes, dtype=object), class_counts)
+        
+        # Dollar amount per asset and whole share quantities
+        asset_dollar_amounts, shares, actual_costs, leftovers, meets_minimum = _alloc_kernel(
+            prices, weights, class_budgets, float(self.min_trade_size)
+        )
+        
+        # Only include if meets minimum trade size
+        skipped = (prices > 0) & (weights > 0) & ~meets_minimum
+        for i in np.flatnonzero(skipped):
+            logger.info(f"Skipping {flat_assets[i]['ticker']}: trade size ${actual_costs[i]:.2f} below minimum ${self.min_trade_size}")
+        
+        trade_orders = []
+        for i in np.flatnonzero(meets_minimum):
+            asset = flat_assets[i]
+            trade_orders.append({
+                'ticker': asset['ticker'],
+                'asset_class': class_names[i],
+                'current_price': asset.get('current_price', 0),
+                'target_amount': float(asset_dollar_amounts[i]),
+                'shares': int(shares[i]),
+                'actual_cost': float(actual_costs[i]),
+                'leftover': float(leftovers[i]),
+                'weight': asset.get('weight', 0),
+                'allocation_percentage': asset.get('allocation_percentage', 0),
+                'composite_score': asset.get('composite_score', 0)
+            })
         
         return trade_orders
     
@@ -101,6 +221,13 @@ class Shopkeeper:
         """
         Optimize leftover cash by suggesting additional shares
         
+        Extra whole shares are chosen to maximise score-weighted dollars
+        deployed (score x price per share). Cash beyond KNAPSACK_MAX_CENTS
+        is poured into the highest-scoring order, as before; the remainder
+        is spread by the knapsack. Only orders that already meet the minimum
+        trade size are topped up; among those, negative scores count as zero
+        and zero-score orders can still take cash.
+        
         Args:
             trade_orders: Current trade orders
             total_budget: Total budget
@@ -112,52 +239,83 @@ class Shopkeeper:
         total_spent = sum(order['actual_cost'] for order in trade_orders)
         total_leftover = total_budget - total_spent
         
-        if total_leftover < self.min_trade_size:
+        if total_leftover < self.min_trade_size or not trade_orders:
             return trade_orders
         
-        # Find the best asset to buy more of (highest score)
-        best_order = max(trade_orders, key=lambda x: x['composite_score'])
+        num_orders = len(trade_orders)
+        prices = np.fromiter((order['current_price'] for order in trade_orders),
+                             dtype=np.float64, count=num_orders)
+        price_cents = np.ceil(np.round(prices * 100, 6)).astype(np.int64)
+        scores = np.fromiter((order['composite_score'] for order in trade_orders),
+                             dtype=np.float64, count=num_orders)
+        costs = np.fromiter((order['actual_cost'] for order in trade_orders),
+                            dtype=np.float64, count=num_orders)
+        
+        # Score per dollar of each extra share; -inf masks orders that can't be topped up
+        eligible = (costs >= self.min_trade_size) & (price_cents > 0)
+        density = np.where(eligible, np.maximum(scores, 0.0) + SCORE_FLOOR, -np.inf)
+        values = density * np.maximum(price_cents, 1)
+        capacity = int(total_leftover * 100)
         
-        # Calculate how many more shares we can buy
-        additional_shares = int(total_leftover / best_order['current_price'])
+        # Pour cash above the knapsack window into the best-scoring eligible order
+        additional_shares = np.zeros(num_orders, dtype=np.int64)
+        best = int(np.argmax(density))
+        best_cents = int(price_cents[best])
+        if capacity > KNAPSACK_MAX_CENTS and eligible[best]:
+            prefill = min(-(-(capacity - KNAPSACK_MAX_CENTS) // best_cents), capacity // best_cents)
+            additional_shares[best] = prefill
+            capacity -= prefill * best_cents
         
-        if additional_shares > 0:
-            additional_cost = additional_shares * best_order['current_price']
-            best_order['shares'] += additional_shares
-            best_order['actual_cost'] += additional_cost
-            best_order['leftover'] = total_leftover - additional_cost
+        # Spend the rest exactly over whole shares of the eligible orders
+        additional_shares += _knapsack_kernel(price_cents, values,
+                                              min(capacity, KNAPSACK_MAX_CENTS))
+        
+        bought = np.flatnonzero(additional_shares)
+        if bought.size == 0:
+            return trade_orders
+        
+        additional_costs = additional_shares * prices
+        remaining = total_leftover - float(additional_costs.sum())
+        for i in bought:
+            order = trade_orders[i]
+            order['shares'] += int(additional_shares[i])
+            order['actual_cost'] += float(additional_costs[i])
+            order['leftover'] = remaining
             
-            logger.info(f"Optimized: added {additional_shares} shares of {best_order['ticker']}")
+            logger.info(f"Optimized: added {additional_shares[i]} shares of {order['ticker']}")
         
         return trade_orders
     
     def create_buy_list(self, trade_orders: List[Dict], 
-                       total_budget: float) -> Dict:
+                       total_budget: float,
+                       now: Optional[datetime] = None) -> Dict:
         """
         Create final buy list with summary
         
         Args:
             trade_orders: Trade orders
             total_budget: Total budget
+            now: Creation timestamp (defaults to the current time)
             
         Returns:
             Complete buy list with summary
         """
         # Sort by allocation percentage (highest first)
-        trade_orders.sort(key=lambda x: x['allocation_percentage'], reverse=True)
-        
-        # Calculate summary statistics
-        total_spent = sum(order['actual_cost'] for order in trade_orders)
-        total_leftover = total_budget - total_spent
-        total_shares = sum(order['shares'] for order in trade_orders)
+        trade_orders.sort(key=itemgetter('allocation_percentage'), reverse=True)
         
-        # Group by asset class
+        # Group by asset class and accumulate the summary totals in one pass
         by_class = {}
+        class_totals = {}
+        total_spent = 0
+        total_shares = 0
         for order in trade_orders:
             asset_class = order['asset_class']
-            if asset_class not in by_class:
-                by_class[asset_class] = []
-            by_class[asset_class].append(order)
+            cost = order['actual_cost']
+            by_class.setdefault(asset_class, []).append(order)
+            class_totals[asset_class] = class_totals.get(asset_class, 0) + cost
+            total_spent += cost
+            total_shares += order['shares']
+        total_leftover = total_budget - total_spent
         
         return {
             'trade_orders': trade_orders,
@@ -167,9 +325,10 @@ class Shopkeeper:
                 'total_leftover': total_leftover,
                 'total_shares': total_shares,
                 'num_assets': len(trade_orders),
-                'by_class': by_class
+                'by_class': by_class,
+                'class_totals': class_totals
             },
-            'created_at': datetime.now().isoformat()
+            'created_at': (now or datetime.now()).isoformat()
         }
     
     def create_rebalance_orders(self, current_portfolio: Dict[str, float], 
@@ -186,30 +345,30 @@ class Shopkeeper:
         Returns:
             List of rebalancing orders
         """
-        rebalance_orders = []
+        asset_classes = list(target_allocation)
+        count = len(asset_classes)
+        target_weights = np.fromiter(target_allocation.values(), dtype=np.float64, count=count)
+        current_weights = np.fromiter((current_portfolio.get(c, 0) for c in asset_classes),
+                                      dtype=np.float64, count=count)
+        weight_diffs = target_weights - current_weights
         
-        for asset_class in target_allocation:
-            current_weight = current_portfolio.get(asset_class, 0)
-            target_weight = target_allocation[asset_class]
-            weight_diff = target_weight - current_weight
-            
-            if abs(weight_diff) > 0.01:  # Only rebalance if difference > 1%
-                dollar_diff = weight_diff * portfolio_value
-                
-                if dollar_diff > 0:
-                    action = 'BUY'
-                else:
-                    action = 'SELL'
-                    dollar_diff = abs(dollar_diff)
-                
-                rebalance_orders.append({
-                    'asset_class': asset_class,
-                    'action': action,
-                    'current_weight': current_weight,
-                    'target_weight': target_weight,
-                    'weight_diff': weight_diff,
-                    'dollar_amount': dollar_diff
-                })
+        # Only rebalance if difference > 1%
+        needs_rebalance = np.abs(weight_diffs) > 0.01
+        dollar_diffs = weight_diffs * portfolio_value
+        actions = np.where(dollar_diffs > 0, 'BUY', 'SELL')
+        dollar_amounts = np.abs(dollar_diffs)
+        
+        rebalance_orders = []
+        for i in np.flatnonzero(needs_rebalance):
+            asset_class = asset_classes[i]
+            rebalance_orders.append({
+                'asset_class': asset_class,
+                'action': str(actions[i]),
+                'current_weight': current_portfolio.get(asset_class, 0),
+                'target_weight': target_allocation[asset_class],
+                'weight_diff': float(weight_diffs[i]),
+                'dollar_amount': float(dollar_amounts[i])
+            })
         
         return rebalance_orders
     
@@ -242,15 +401,14 @@ class Shopkeeper:
         output.append(f"{'Ticker':<12} {'Price':<8} {'Shares':<8} {'Cost':<12} {'%':<6}")
         output.append("-" * 60)
         
-        for order in buy_list['trade_orders']:
-            percentage = order['allocation_percentage'] * 100
-            output.append(
-                f"{order['ticker']:<12} "
-                f"${order['current_price']:<7.2f} "
-                f"{order['shares']:<8} "
-                f"${order['actual_cost']:<11.2f} "
-                f"{percentage:<5.1f}%"
-            )
+        orders = buy_list['trade_orders']
+        percentages = np.fromiter((order['allocation_percentage'] for order in orders),
+                                  dtype=np.float64, count=len(orders)) * 100
+        row_format = self.ROW_TMPL.format_map
+        output.extend(
+            row_format({**order, 'pct': percentage})
+            for order, percentage in zip(orders, percentages.tolist())
+        )
         
         output.append("")
         output.append("=" * 60)
@@ -274,9 +432,15 @@ class Shopkeeper:
         leftover_percentage = (summary['total_leftover'] / summary['total_budget']) * 100
         
         # Asset class breakdown
+        class_totals = summary.get('class_totals')
+        if class_totals is None:
+            class_totals = {}
+            for order in buy_list['trade_orders']:
+                asset_class = order['asset_class']
+                class_totals[asset_class] = class_totals.get(asset_class, 0) + order['actual_cost']
         class_breakdown = {}
         for asset_class, orders in summary['by_class'].items():
-            class_total = sum(order['actual_cost'] for order in orders)
+            class_total = class_totals[asset_class]
             class_breakdown[asset_class] = {
                 'amount': class_total,
                 'percentage': (class_total / summary['total_spent']) * 100 if summary['total_spent'] > 0 else 0,
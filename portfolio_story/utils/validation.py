@@ -15,13 +15,26 @@ Key Features:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable, Hashable
 import logging
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
+from collections import Counter, OrderedDict
+import copy
+import functools
+import hashlib
+import time
 import warnings
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
 class ValidationError(Exception):
@@ -34,7 +47,12 @@ class ValidationSeverity(Enum):
     WARNING = "warning"  # Should fix - may cause issues
     INFO = "info"        # Informational - best practice
 
-@dataclass
+# Module-level aliases so result construction skips the enum attribute lookup
+_ERR = ValidationSeverity.ERROR
+_WARN = ValidationSeverity.WARNING
+_INFO = ValidationSeverity.INFO
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation check."""
     is_valid: bool
@@ -45,6 +63,184 @@ class ValidationResult:
     suggested_fix: Optional[str] = None
     details: Optional[Dict[str, Any]] = None
 
+@njit(cache=True)
+def _scan_ohlc(prices):
+    """
+    Scan price columns for non-positive values and extreme daily moves.
+    
+    Args:
+        prices: Price block (float64 array, rows are days, columns are series)
+        
+    Returns:
+        Tuple of (non_positive, extreme_counts) per column, where an extreme
+        move is a day-over-day change of more than 50%
+    """
+    n_rows, n_cols = prices.shape
+    non_positive = np.zeros(n_cols, dtype=np.bool_)
+    extreme_counts = np.zeros(n_cols, dtype=np.int64)
+    
+    for j in range(n_cols):
+        for i in range(n_rows):
+            current = prices[i, j]
+            if current <= 0:
+                non_positive[j] = True
+            if i == 0:
+                continue
+            previous = prices[i - 1, j]
+            if previous == 0:
+                # Any finite or infinite move off zero is unbounded; 0 -> 0 and NaN are not
+                if current != 0 and current == current:
+                    extreme_counts[j] += 1
+            elif abs(current / previous - 1.0) > 0.5:
+                extreme_counts[j] += 1
+    
+    return non_positive, extreme_counts
+
+
+# Warm the kernel at import so the first real call doesn't pay the JIT cost
+_scan_ohlc(np.ones((2, 1)))
+
+
+def _cholesky_psd(matrix: np.ndarray, tolerance: float = 1e-10) -> bool:
+    """
+    Cheap positive semi-definiteness test for a symmetric matrix.
+    
+    A Cholesky factor of ``matrix + tolerance * I`` exists exactly when no
+    eigenvalue falls below ``-tolerance``, so this matches the eigenvalue
+    check without computing the spectrum.
+    """
+    try:
+        factor = np.linalg.cholesky(matrix + tolerance * np.eye(matrix.shape[0]))
+    except np.linalg.LinAlgError:
+        return False
+    return bool(np.isfinite(factor).all())
+
+@functools.lru_cache(maxsize=1)
+def _now_for_second(second: int) -> pd.Timestamp:
+    return pd.Timestamp.now()
+
+def _now() -> pd.Timestamp:
+    """Current timestamp, reused by every validation within the same second."""
+    return _now_for_second(int(time.monotonic()))
+
+def _digest(*parts: bytes) -> bytes:
+    """Short blake2b content digest used as a validation cache key."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
+
+def _array_key(name: str, values: np.ndarray, *extra: bytes) -> Optional[Hashable]:
+    """Cache key for an array input: shape, dtype and content digest."""
+    if values.dtype.hasobject:
+        return None  # Object arrays hold pointers, not content - don't cache
+    values = np.ascontiguousarray(values)
+    return (name, values.shape, values.dtype.str, _digest(values.tobytes(), *extra))
+
+def _covariance_key(cov_matrix: pd.DataFrame) -> Optional[Hashable]:
+    return _array_key('covariance', cov_matrix.to_numpy())
+
+def _expected_returns_key(expected_returns: pd.Series) -> Optional[Hashable]:
+    # Asset labels appear in the messages, so they are part of the key
+    return _array_key('expected_returns', expected_returns.to_numpy(),
+                      repr(expected_returns.index.tolist()).encode())
+
+def _asset_data_key(data: pd.DataFrame,
+                    required_columns: List[str] = None) -> Optional[Hashable]:
+    # Column names and dtypes shape the results, so they are part of the key
+    return _array_key('asset_data', data.to_numpy(),
+                      repr((data.columns.tolist(), data.dtypes.tolist(), required_columns)).encode())
+
+def _weights_key(weights: Dict[str, float], max_single_weight: float = 0.4,
+                 min_weight: float = 0.0) -> Hashable:
+    return ('weights', _digest(repr(tuple(weights.items())).encode()),
+            max_single_weight, min_weight)
+
+def _copy_results(results) -> List[ValidationResult]:
+    """Shallow copies of cached results, so callers can't modify the cache."""
+    return [copy.copy(result) for result in results]
+
+def _cached_validation(key_func: Callable[..., Optional[Hashable]]):
+    """
+    Memoize a validator method on a content key of its inputs.
+    
+    Results are kept in the validator's bounded LRU cache. Runs that report
+    an error are never cached, so a miss is always preferred over reusing a
+    failing verdict. Callers always get their own result objects.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = key_func(*args, **kwargs)
+            if key is None:
+                return method(self, *args, **kwargs)
+            cache = self._cache
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return _copy_results(cached)
+            
+            results = method(self, *args, **kwargs)
+            if not any(r.severity is _ERR for r in results):
+                cache[key] = tuple(_copy_results(results))
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+            return results
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=256)
+def _risk_parameter_results(target_vol: float, var_confidence: float,
+                            max_drawdown: float) -> Tuple[ValidationResult, ...]:
+    """
+    Validate risk management parameters (cached backend of
+    PortfolioValidator.validate_risk_parameters).
+    
+    Args:
+        target_vol: Target portfolio volatility
+        var_confidence: VaR confidence level
+        max_drawdown: Maximum drawdown limit
+        
+    Returns:
+        Tuple of validation results
+    """
+    results = []
+    
+    # Validate target volatility
+    if not (0.01 <= target_vol <= 0.5):  # 1% to 50%
+        results.append(ValidationResult(
+            is_valid=False,
+            severity=_ERR,
+            message=f"Target volatility out of range: {target_vol:.3f}",
+            component="risk_validation",
+            field="target_volatility",
+            suggested_fix="Set target volatility between 1% and 50%"
+        ))
+    
+    # Validate VaR confidence level
+    if not (0.9 <= var_confidence <= 0.99):
+        results.append(ValidationResult(
+            is_valid=False,
+            severity=_WARN,
+            message=f"VaR confidence level out of recommended range: {var_confidence:.3f}",
+            component="risk_validation",
+            field="var_confidence_level",
+            suggested_fix="Use confidence level between 90% and 99%"
+        ))
+    
+    # Validate drawdown limit
+    if not (0.05 <= max_drawdown <= 0.5):  # 5% to 50%
+        results.append(ValidationResult(
+            is_valid=False,
+            severity=_WARN,
+            message=f"Maximum drawdown limit out of range: {max_drawdown:.3f}",
+            component="risk_validation",
+            field="max_drawdown_limit",
+            suggested_fix="Set drawdown limit between 5% and 50%"
+        ))
+    
+    return tuple(results)
+
 class PortfolioValidator:
     """
     Comprehensive validator for portfolio management system.
@@ -58,7 +254,11 @@ class PortfolioValidator:
         """Initialize the portfolio validator."""
         self.validation_results = []
         self.error_threshold = 0.05  # 5% error threshold for calculations
+        self.cache_size = 128  # Maximum number of cached validation runs
+        self._cache: "OrderedDict[Hashable, Tuple[ValidationResult, ...]]" = OrderedDict()
+        self._numcols_cache: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
         
+    @_cached_validation(_asset_data_key)
     def validate_asset_data(self, data: pd.DataFrame, 
                           required_columns: List[str] = None) -> List[ValidationResult]:
         """
@@ -80,19 +280,21 @@ class PortfolioValidator:
         if data.empty:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message="Asset data is empty",
                 component="data_validation",
                 field="data_frame"
             ))
             return results
         
+        n_rows, n_cols = data.shape
+        
         # Check required columns
         missing_columns = [col for col in required_columns if col not in data.columns]
         if missing_columns:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message=f"Missing required columns: {missing_columns}",
                 component="data_validation",
                 field="columns",
@@ -101,22 +303,26 @@ class PortfolioValidator:
         
         # Check for sufficient data points
         min_data_points = 30
-        if len(data) < min_data_points:
+        if n_rows < min_data_points:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.WARNING,
-                message=f"Insufficient data points: {len(data)} < {min_data_points}",
+                severity=_WARN,
+                message=f"Insufficient data points: {n_rows} < {min_data_points}",
                 component="data_validation",
                 field="data_length",
                 suggested_fix="Use data with at least 30 trading days"
             ))
         
         # Check for missing values
-        missing_percentage = data.isnull().sum().sum() / (len(data) * len(data.columns))
+        if all(dtype.kind == 'f' for dtype in data.dtypes):
+            values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+            missing_percentage = float(np.isnan(values).mean())
+        else:
+            missing_percentage = data.isnull().to_numpy().sum() / (n_rows * n_cols)
         if missing_percentage > 0.1:  # More than 10% missing
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.WARNING,
+                severity=_WARN,
                 message=f"High missing data percentage: {missing_percentage:.1%}",
                 component="data_validation",
                 field="missing_data",
@@ -124,38 +330,40 @@ class PortfolioValidator:
             ))
         
         # Check for unrealistic price values
-        for col in ['Open', 'High', 'Low', 'Close']:
-            if col in data.columns:
-                if (data[col] <= 0).any():
-                    results.append(ValidationResult(
+        price_columns = [col for col in ['Open', 'High', 'Low', 'Close'] if col in data.columns]
+        if price_columns:
+            # Non-positive prices and extreme movements (>50% in one day) in one pass
+            prices = data[price_columns].to_numpy(dtype=np.float64)
+            non_positive, extreme_counts = _scan_ohlc(prices)
+            
+            append = results.append
+            for col, has_non_positive, extreme_count in zip(price_columns, non_positive, extreme_counts):
+                if has_non_positive:
+                    append(ValidationResult(
                         is_valid=False,
-                        severity=ValidationSeverity.ERROR,
+                        severity=_ERR,
                         message=f"Non-positive prices found in {col}",
                         component="data_validation",
                         field=col,
                         suggested_fix="Remove or correct non-positive price data"
                     ))
                 
-                # Check for extreme price movements (>50% in one day)
-                if len(data) > 1:
-                    returns = data[col].pct_change().dropna()
-                    extreme_moves = abs(returns) > 0.5
-                    if extreme_moves.any():
-                        results.append(ValidationResult(
-                            is_valid=False,
-                            severity=ValidationSeverity.WARNING,
-                            message=f"Extreme price movements detected in {col}: {extreme_moves.sum()} days",
-                            component="data_validation",
-                            field=col,
-                            suggested_fix="Review data for splits, dividends, or errors"
-                        ))
+                if extreme_count:
+                    append(ValidationResult(
+                        is_valid=False,
+                        severity=_WARN,
+                        message=f"Extreme price movements detected in {col}: {extreme_count} days",
+                        component="data_validation",
+                        field=col,
+                        suggested_fix="Review data for splits, dividends, or errors"
+                    ))
         
         # Check volume data
         if 'Volume' in data.columns:
             if (data['Volume'] < 0).any():
                 results.append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.ERROR,
+                    severity=_ERR,
                     message="Negative volume data found",
                     component="data_validation",
                     field="Volume",
@@ -164,6 +372,7 @@ class PortfolioValidator:
         
         return results
     
+    @_cached_validation(_weights_key)
     def validate_portfolio_weights(self, weights: Dict[str, float],
                                  max_single_weight: float = 0.4,
                                  min_weight: float = 0.0) -> List[ValidationResult]:
@@ -183,41 +392,49 @@ class PortfolioValidator:
         if not weights:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message="Portfolio weights are empty",
                 component="portfolio_validation",
                 field="weights"
             ))
             return results
         
+        assets = list(weights)
+        weight_values = np.fromiter(weights.values(), dtype=np.float64, count=len(assets))
+        
         # Check weight sum
-        weight_sum = sum(weights.values())
+        weight_sum = weight_values.sum()
         if abs(weight_sum - 1.0) > 0.01:  # 1% tolerance
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message=f"Weights do not sum to 1.0: {weight_sum:.6f}",
                 component="portfolio_validation",
                 field="weight_sum",
                 suggested_fix="Normalize weights to sum to 1.0"
             ))
         
-        # Check individual weights
-        for asset, weight in weights.items():
-            if weight < min_weight:
-                results.append(ValidationResult(
+        # Check individual weights (only the violating assets are visited)
+        below_min = weight_values < min_weight
+        above_max = weight_values > max_single_weight
+        append = results.append
+        for i in np.flatnonzero(below_min | above_max):
+            asset = assets[i]
+            weight = weight_values[i]
+            if below_min[i]:
+                append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.WARNING,
+                    severity=_WARN,
                     message=f"Asset {asset} has negative weight: {weight:.6f}",
                     component="portfolio_validation",
                     field=f"weight_{asset}",
                     suggested_fix="Set minimum weight to 0 or remove asset"
                 ))
             
-            if weight > max_single_weight:
-                results.append(ValidationResult(
+            if above_max[i]:
+                append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.WARNING,
+                    severity=_WARN,
                     message=f"Asset {asset} exceeds maximum weight: {weight:.6f} > {max_single_weight}",
                     component="portfolio_validation",
                     field=f"weight_{asset}",
@@ -236,46 +453,17 @@ class PortfolioValidator:
         Returns:
             List of validation results
         """
-        results = []
-        
-        # Validate target volatility
-        target_vol = risk_config.get('target_volatility', 0.1)
-        if not (0.01 <= target_vol <= 0.5):  # 1% to 50%
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.ERROR,
-                message=f"Target volatility out of range: {target_vol:.3f}",
-                component="risk_validation",
-                field="target_volatility",
-                suggested_fix="Set target volatility between 1% and 50%"
-            ))
-        
-        # Validate VaR confidence level
-        var_confidence = risk_config.get('var_confidence_level', 0.95)
-        if not (0.9 <= var_confidence <= 0.99):
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.WARNING,
-                message=f"VaR confidence level out of recommended range: {var_confidence:.3f}",
-                component="risk_validation",
-                field="var_confidence_level",
-                suggested_fix="Use confidence level between 90% and 99%"
-            ))
-        
-        # Validate drawdown limit
-        max_drawdown = risk_config.get('max_drawdown_limit', 0.25)
-        if not (0.05 <= max_drawdown <= 0.5):  # 5% to 50%
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.WARNING,
-                message=f"Maximum drawdown limit out of range: {max_drawdown:.3f}",
-                component="risk_validation",
-                field="max_drawdown_limit",
-                suggested_fix="Set drawdown limit between 5% and 50%"
-            ))
-        
-        return results
+        args = (
+            risk_config.get('target_volatility', 0.1),
+            risk_config.get('var_confidence_level', 0.95),
+            risk_config.get('max_drawdown_limit', 0.25)
+        )
+        try:
+            return _copy_results(_risk_parameter_results(*args))
+        except TypeError:  # Unhashable value (e.g. a 0-d array) - validate without the cache
+            return list(_risk_parameter_results.__wrapped__(*args))
     
+    @_cached_validation(_covariance_key)
     def validate_covariance_matrix(self, cov_matrix: pd.DataFrame) -> List[ValidationResult]:
         """
         Validate covariance matrix properties.
@@ -291,7 +479,7 @@ class PortfolioValidator:
         if cov_matrix.empty:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message="Covariance matrix is empty",
                 component="covariance_validation",
                 field="cov_matrix"
@@ -302,58 +490,67 @@ class PortfolioValidator:
         if cov_matrix.shape[0] != cov_matrix.shape[1]:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message=f"Covariance matrix is not square: {cov_matrix.shape}",
                 component="covariance_validation",
                 field="matrix_shape"
             ))
+            return results
         
-        # Check for NaN values
-        if cov_matrix.isnull().any().any():
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.ERROR,
-                message="Covariance matrix contains NaN values",
-                component="covariance_validation",
-                field="nan_values"
-            ))
+        values = cov_matrix.to_numpy(dtype=np.float64)
         
-        # Check for infinite values
-        if np.isinf(cov_matrix.values).any():
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.ERROR,
-                message="Covariance matrix contains infinite values",
-                component="covariance_validation",
-                field="infinite_values"
-            ))
+        # Check for NaN and infinite values in one pass; later checks are
+        # meaningless on non-finite entries
+        if not np.isfinite(values).all():
+            if np.isnan(values).any():
+                results.append(ValidationResult(
+                    is_valid=False,
+                    severity=_ERR,
+                    message="Covariance matrix contains NaN values",
+                    component="covariance_validation",
+                    field="nan_values"
+                ))
+            
+            if np.isinf(values).any():
+                results.append(ValidationResult(
+                    is_valid=False,
+                    severity=_ERR,
+                    message="Covariance matrix contains infinite values",
+                    component="covariance_validation",
+                    field="infinite_values"
+                ))
+            return results
         
-        # Check symmetry
-        if not np.allclose(cov_matrix.values, cov_matrix.values.T, atol=1e-10):
+        # Check symmetry on the strict upper triangle against its mirror
+        upper = np.triu_indices(values.shape[0], k=1)
+        is_symmetric = np.allclose(values[upper], values.T[upper], atol=1e-10)
+        if not is_symmetric:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message="Covariance matrix is not symmetric",
                 component="covariance_validation",
                 field="symmetry"
             ))
         
-        # Check positive semi-definiteness
+        # Check positive semi-definiteness (Cholesky fast path, eigenvalues only
+        # when the matrix is asymmetric or the factorization fails)
         try:
-            eigenvalues = np.linalg.eigvals(cov_matrix.values)
-            if np.any(eigenvalues < -1e-10):  # Small tolerance for numerical errors
-                results.append(ValidationResult(
-                    is_valid=False,
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Covariance matrix is not positive semi-definite. Min eigenvalue: {eigenvalues.min():.2e}",
-                    component="covariance_validation",
-                    field="positive_definite",
-                    suggested_fix="Use shrinkage estimation or regularization"
-                ))
+            if not (is_symmetric and _cholesky_psd(values)):
+                eigenvalues = np.linalg.eigvals(values)
+                if np.any(eigenvalues < -1e-10):  # Small tolerance for numerical errors
+                    results.append(ValidationResult(
+                        is_valid=False,
+                        severity=_ERR,
+                        message=f"Covariance matrix is not positive semi-definite. Min eigenvalue: {eigenvalues.min():.2e}",
+                        component="covariance_validation",
+                        field="positive_definite",
+                        suggested_fix="Use shrinkage estimation or regularization"
+                    ))
         except np.linalg.LinAlgError:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message="Failed to compute eigenvalues of covariance matrix",
                 component="covariance_validation",
                 field="eigenvalue_computation"
@@ -361,6 +558,7 @@ class PortfolioValidator:
         
         return results
     
+    @_cached_validation(_expected_returns_key)
     def validate_expected_returns(self, expected_returns: pd.Series) -> List[ValidationResult]:
         """
         Validate expected returns vector.
@@ -376,40 +574,44 @@ class PortfolioValidator:
         if expected_returns.empty:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message="Expected returns vector is empty",
                 component="returns_validation",
                 field="expected_returns"
             ))
             return results
         
-        # Check for NaN values
-        if expected_returns.isnull().any():
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.ERROR,
-                message="Expected returns contain NaN values",
-                component="returns_validation",
-                field="nan_values"
-            ))
+        values = expected_returns.to_numpy(dtype=np.float64)
         
-        # Check for infinite values
-        if np.isinf(expected_returns.values).any():
-            results.append(ValidationResult(
-                is_valid=False,
-                severity=ValidationSeverity.ERROR,
-                message="Expected returns contain infinite values",
-                component="returns_validation",
-                field="infinite_values"
-            ))
+        # Check for NaN and infinite values (only inspected when something is non-finite)
+        finite = np.isfinite(values)
+        if not finite.all():
+            non_finite = values[~finite]
+            if np.isnan(non_finite).any():
+                results.append(ValidationResult(
+                    is_valid=False,
+                    severity=_ERR,
+                    message="Expected returns contain NaN values",
+                    component="returns_validation",
+                    field="nan_values"
+                ))
+            
+            if np.isinf(non_finite).any():
+                results.append(ValidationResult(
+                    is_valid=False,
+                    severity=_ERR,
+                    message="Expected returns contain infinite values",
+                    component="returns_validation",
+                    field="infinite_values"
+                ))
         
         # Check for unrealistic returns
-        extreme_returns = abs(expected_returns) > 1.0  # More than 100% annual return
+        extreme_returns = np.abs(values) > 1.0  # More than 100% annual return
         if extreme_returns.any():
-            extreme_assets = expected_returns[extreme_returns].index.tolist()
+            extreme_assets = expected_returns.index[extreme_returns].tolist()
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.WARNING,
+                severity=_WARN,
                 message=f"Unrealistic expected returns (>100%) for assets: {extreme_assets}",
                 component="returns_validation",
                 field="extreme_returns",
@@ -444,7 +646,7 @@ class PortfolioValidator:
         if abs(sharpe_ratio - expected_return / volatility) > 1e-6:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message=f"Sharpe ratio inconsistency: {sharpe_ratio:.6f} vs {expected_return/volatility:.6f}",
                 component="optimization_validation",
                 field="sharpe_ratio"
@@ -454,7 +656,7 @@ class PortfolioValidator:
         if volatility <= 0:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message=f"Non-positive volatility: {volatility:.6f}",
                 component="optimization_validation",
                 field="volatility"
@@ -463,7 +665,7 @@ class PortfolioValidator:
         if abs(expected_return) > 1.0:  # More than 100% annual return
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.WARNING,
+                severity=_WARN,
                 message=f"Unrealistic expected return: {expected_return:.1%}",
                 component="optimization_validation",
                 field="expected_return"
@@ -489,7 +691,7 @@ class PortfolioValidator:
             if field not in config:
                 results.append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.ERROR,
+                    severity=_ERR,
                     message=f"Missing required field: {field}",
                     component="config_validation",
                     field=field
@@ -501,7 +703,7 @@ class PortfolioValidator:
             if config['risk_level'] not in valid_risk_levels:
                 results.append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.ERROR,
+                    severity=_ERR,
                     message=f"Invalid risk level: {config['risk_level']}",
                     component="config_validation",
                     field="risk_level",
@@ -513,7 +715,7 @@ class PortfolioValidator:
             if not isinstance(config['preferred_assets'], list):
                 results.append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.ERROR,
+                    severity=_ERR,
                     message="Preferred assets must be a list",
                     component="config_validation",
                     field="preferred_assets"
@@ -521,7 +723,7 @@ class PortfolioValidator:
             elif len(config['preferred_assets']) < 2:
                 results.append(ValidationResult(
                     is_valid=False,
-                    severity=ValidationSeverity.WARNING,
+                    severity=_WARN,
                     message="Portfolio should have at least 2 assets for diversification",
                     component="config_validation",
                     field="preferred_assets"
@@ -546,7 +748,7 @@ class PortfolioValidator:
         if data.empty:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.ERROR,
+                severity=_ERR,
                 message=f"{data_type} is empty",
                 component="data_quality",
                 field="empty_data"
@@ -556,13 +758,15 @@ class PortfolioValidator:
         # Check data freshness
         if 'Date' in data.columns or data.index.name == 'Date':
             if isinstance(data.index, pd.DatetimeIndex):
-                latest_date = data.index.max()
-                days_old = (pd.Timestamp.now() - latest_date).days
+                # A sorted index has its latest date last - skip the O(n) scan
+                index = data.index
+                latest_date = index[-1] if index.is_monotonic_increasing else index.max()
+                days_old = (_now() - latest_date).days
                 
                 if days_old > 30:
                     results.append(ValidationResult(
                         is_valid=False,
-                        severity=ValidationSeverity.WARNING,
+                        severity=_WARN,
                         message=f"Data is {days_old} days old",
                         component="data_quality",
                         field="data_freshness",
@@ -570,31 +774,51 @@ class PortfolioValidator:
                     ))
         
         # Check for duplicates
-        if data.duplicated().any():
-            duplicate_count = data.duplicated().sum()
+        duplicate_count = int(data.duplicated().to_numpy().sum())
+        if duplicate_count:
             results.append(ValidationResult(
                 is_valid=False,
-                severity=ValidationSeverity.WARNING,
+                severity=_WARN,
                 message=f"Found {duplicate_count} duplicate rows",
                 component="data_quality",
                 field="duplicates",
                 suggested_fix="Remove duplicate entries"
             ))
         
-        # Check for constant values (no variation)
-        for col in data.select_dtypes(include=[np.number]).columns:
-            if data[col].nunique() <= 1:
-                results.append(ValidationResult(
-                    is_valid=False,
-                    severity=ValidationSeverity.WARNING,
-                    message=f"Column {col} has no variation",
-                    component="data_quality",
-                    field=f"constant_{col}",
-                    suggested_fix="Check data source or remove constant columns"
-                ))
+        # Check for constant values (no variation): min equals max, or no values at all
+        numeric = data.iloc[:, self._numeric_positions(data)]
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN columns
+            col_min = np.nanmin(values, axis=0)
+            col_max = np.nanmax(values, axis=0)
+        constant = (col_min == col_max) | np.isnan(col_min)
+        append = results.append
+        for col in numeric.columns[constant]:
+            append(ValidationResult(
+                is_valid=False,
+                severity=_WARN,
+                message=f"Column {col} has no variation",
+                component="data_quality",
+                field=f"constant_{col}",
+                suggested_fix="Check data source or remove constant columns"
+            ))
         
         return results
     
+    def _numeric_positions(self, data: pd.DataFrame) -> np.ndarray:
+        """Positions of the numeric columns, cached per column layout."""
+        key = (tuple(data.columns), tuple(data.dtypes.tolist()))
+        positions = self._numcols_cache.get(key)
+        if positions is None:
+            positions = np.flatnonzero(data.columns.isin(data.select_dtypes(include=[np.number]).columns))
+            self._numcols_cache[key] = positions
+            if len(self._numcols_cache) > 32:
+                self._numcols_cache.popitem(last=False)
+        else:
+            self._numcols_cache.move_to_end(key)
+        return positions
+    
     def get_validation_summary(self, results: List[ValidationResult]) -> Dict[str, Any]:
         """
         Get summary of validation results.
@@ -606,9 +830,10 @@ class PortfolioValidator:
             Validation summary dictionary
         """
         total_results = len(results)
-        error_count = sum(1 for r in results if r.severity == ValidationSeverity.ERROR)
-        warning_count = sum(1 for r in results if r.severity == ValidationSeverity.WARNING)
-        info_count = sum(1 for r in results if r.severity == ValidationSeverity.INFO)
+        severity_counts = Counter(r.severity for r in results)
+        error_count = severity_counts[_ERR]
+        warning_count = severity_counts[_WARN]
+        info_count = severity_counts[_INFO]
         
         is_valid = error_count == 0
         
@@ -19,15 +19,27 @@ try:
         print("Press Ctrl+C to stop the dashboard")
         print("-" * 50)
         
-    # Run the dashboard with performance optimizations
-    app.run(
-        debug=False,  # Disable debug mode for better performance
-        host='0.0.0.0',
-        port=8050,
-        dev_tools_hot_reload=False,  # Disable hot reload to prevent auto-refresh
-        dev_tools_ui=False,  # Disable dev tools UI
-        threaded=True  # Enable threading for better performance
-    )
+    try:
+        # Serve through waitress's bounded thread pool when it is installed
+        from waitress import serve
+        serve(
+            app.server,
+            host='0.0.0.0',
+            port=8050,
+            threads=16,  # Fixed worker pool instead of a thread per request
+            connection_limit=200,  # Queue excess connections rather than accept them
+            channel_timeout=60  # Drop idle connections
+        )
+    except ImportError:
+        # Run the dashboard with performance optimizations
+        app.run(
+            debug=False,  # Disable debug mode for better performance
+            host='0.0.0.0',
+            port=8050,
+            dev_tools_hot_reload=False,  # Disable hot reload to prevent auto-refresh
+            dev_tools_ui=False,  # Disable dev tools UI
+            threaded=True  # Enable threading for better performance
+        )
         
 except ImportError as e:
     print(f"Error importing dashboard: {e}")
@@ -6,8 +6,8 @@ Optimized for cloud deployment with proper configuration
 
 import os
 import sys
+import shutil
 import logging
-from portfolio_story.ui.dashboard import app
 
 # Configure logging for production
 logging.basicConfig(
@@ -17,6 +17,28 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Each worker imports pandas, dash and numba; keep the default small for
+# containers, where os.cpu_count() reports the host's CPUs
+DEFAULT_WORKERS = 2
+
+def run_gunicorn(host: str, port: int):
+    """
+    Replace this process with gunicorn serving the dashboard's WSGI app.
+    
+    The app is not preloaded: each worker imports it after the fork, so the
+    logging queue listener thread runs in every worker.
+    """
+    workers = os.environ.get("WEB_CONCURRENCY", str(DEFAULT_WORKERS))
+    logger.info(f"🧵 Serving with gunicorn: {workers} workers x 4 threads")
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "--workers", workers,
+        "--worker-class", "gthread",
+        "--threads", "4",
+        "--bind", f"{host}:{port}",
+        "portfolio_story.ui.dashboard:server"
+    ])
+
 if __name__ == "__main__":
     # Get configuration from environment variables
     port = int(os.environ.get("PORT", 8050))
@@ -29,6 +51,12 @@ if __name__ == "__main__":
     logger.info("🌐 Optimized for cloud deployment")
     
     try:
+        # Multi-process gunicorn where available; the built-in server otherwise
+        if not debug and shutil.which("gunicorn"):
+            run_gunicorn(host, port)
+        
+        from portfolio_story.ui.dashboard import app
+        
         # Run with production settings
         app.run(
             debug=debug,